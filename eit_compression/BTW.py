@@ -1,6 +1,8 @@
 import heapq
 from collections import defaultdict
 
+from .rle import zero_run_encoding
+
 
 def suffix_array(input_string):
     n = len(input_string)
@@ -51,20 +53,6 @@ def move_to_front(input_string):
     return output
 
 
-def run_length_encoding(input_list):
-    """Run-Length Encoding"""
-    encoded = []
-    count = 1
-    for i in range(1, len(input_list)):
-        if input_list[i] == input_list[i - 1]:
-            count += 1
-        else:
-            encoded.append((input_list[i - 1], count))
-            count = 1
-    encoded.append((input_list[-1], count))  # Append the last run
-    return encoded
-
-
 def huffman_coding(input_list):
     """Huffman Coding"""
     freq = defaultdict(int)
@@ -108,12 +96,11 @@ def compress_file(file_path):
     # Step 3: Apply Move-to-Front Transformation
     mtf_result = move_to_front(bwt_result)
 
-    # Step 4: Apply Run-Length Encoding
-    rle_result = run_length_encoding(mtf_result)
+    # Step 4: Apply RUNA/RUNB zero run encoding, which keeps the symbol alphabet bounded
+    rle_result = zero_run_encoding(mtf_result).tolist()
 
     # Step 5: Apply Huffman Coding
-    huffman_encoded, huffman_codes = huffman_coding(
-        [item for sublist in rle_result for item in sublist])  # Flatten the RLE result
+    huffman_encoded, huffman_codes = huffman_coding(rle_result)
 
     # Save the compressed data to a file
     with open(f"{file_path}.compressed", 'wb') as compressed_file:
@@ -124,7 +111,8 @@ def compress_file(file_path):
     return huffman_encoded, huffman_codes
 
 
-# Example usage
-file_path = "Samp1.bin"  # Change this to the path of the file you want to compress
-compressed_data, huffman_codes = compress_file(file_path)
-print("Huffman Codes:", huffman_codes)
+if __name__ == "__main__":
+    # Example usage
+    file_path = "Samp1.bin"  # Change this to the path of the file you want to compress
+    compressed_data, huffman_codes = compress_file(file_path)
+    print("Huffman Codes:", huffman_codes)
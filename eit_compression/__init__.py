@@ -0,0 +1,47 @@
+"""
+Lossless compression codecs: Huffman, LZ77 (classic and extended), LZ78, run-length
+encoding, a BWT pipeline and the seekable block container.
+
+Importing the package does no work. The public names below are loaded from their
+submodules on first access, and optional dependencies (bitarray, numpy, chardet) are
+only imported by the functions that need them.
+"""
+
+_EXPORTS = {
+    'huffman_compress': 'huffman',
+    'huffman_decompress': 'huffman',
+    'huffman_encode_bytes': 'huffman',
+    'huffman_decode_bytes': 'huffman',
+    'LZ77Compressor': 'lz77',
+    'ExtendedLZ77Compressor': 'lz77_extended',
+    'LZ78Compressor': 'lz78',
+    'lz78_compress': 'lz88_adam',
+    'lz78_decompress': 'lz88_adam',
+    'lz78_encode_bytes': 'lz88_adam',
+    'lz78_decode_bytes': 'lz88_adam',
+    'rle_compress': 'rle',
+    'rle_decompress': 'rle',
+    'rle_encode_bytes': 'rle',
+    'rle_decode_bytes': 'rle',
+    'seekable_compress': 'seekable',
+    'seekable_decompress': 'seekable',
+    'seekable_read': 'seekable',
+    'seekable_verify': 'seekable',
+    'SeekableReader': 'seekable',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,172 @@
+import heapq
+from collections import defaultdict
+
+
+# Bit strings of all 256 byte values, built on first use by huffman_decode_bytes
+_byte_bits = None
+
+
+# Build the Huffman tree
+class HuffmanNode:
+    def __init__(self, char=None, freq=None):
+        self.char = char
+        self.freq = freq
+        self.left = None
+        self.right = None
+
+    def __lt__(self, other):
+        return self.freq < other.freq
+
+
+def build_huffman_tree(data):
+    frequency = defaultdict(int)
+    for byte in data:
+        frequency[byte] += 1
+
+    # Create a priority queue (min-heap) with all the frequency nodes
+    priority_queue = [HuffmanNode(char=char, freq=freq) for char, freq in frequency.items()]
+    heapq.heapify(priority_queue)
+
+    # Build the Huffman tree
+    while len(priority_queue) > 1:
+        left = heapq.heappop(priority_queue)
+        right = heapq.heappop(priority_queue)
+
+        merged = HuffmanNode(freq=left.freq + right.freq)
+        merged.left = left
+        merged.right = right
+
+        heapq.heappush(priority_queue, merged)
+
+    return priority_queue[0]
+
+
+# Generate Huffman Codes from the Tree
+def generate_huffman_codes(node, current_code="", codes=None):
+    if node is None:
+        return
+
+    if codes is None:
+        codes = defaultdict()
+
+    # If this is a leaf node, save the code
+    if node.char is not None:
+        codes[node.char] = current_code
+
+    # Traverse left and right
+    generate_huffman_codes(node.left, current_code + "0", codes)
+    generate_huffman_codes(node.right, current_code + "1", codes)
+
+    return codes
+
+
+# Encode the Data Using Huffman Codes
+def encode_data(data, huffman_codes):
+    return ''.join(huffman_codes[byte] for byte in data)
+
+
+# Step 1: Compression (Storing the Dictionary)
+def huffman_encode_bytes(data):
+    """Encode a bytes object into the Huffman format written by huffman_compress."""
+    if not data:
+        # Empty dictionary, no padding and no payload
+        return (0).to_bytes(4, 'big') + (0).to_bytes(1, 'big')
+
+    # Build the Huffman Tree
+    root = build_huffman_tree(data)
+
+    # Generate Huffman codes
+    huffman_codes = generate_huffman_codes(root)
+
+    # A tree with a single leaf yields an empty code, give it one bit instead
+    if len(huffman_codes) == 1:
+        huffman_codes = {char: "0" for char in huffman_codes}
+
+    # Encode the data
+    encoded_data = encode_data(data, huffman_codes)
+
+    output = bytearray()
+
+    # Write the length of the dictionary first
+    output += len(huffman_codes).to_bytes(4, 'big')
+
+    # Write the dictionary (mapping of character -> Huffman code)
+    for char, code in huffman_codes.items():
+        output += char.to_bytes(1, 'big')  # Write the character
+        output += len(code).to_bytes(1, 'big')  # Write the length of the code
+        output += int(code, 2).to_bytes((len(code) + 7) // 8, 'big')  # Write the Huffman code
+
+    # Calculate padding size (if necessary)
+    if len(encoded_data) % 8 != 0:
+        padding_size = 8 - (len(encoded_data) % 8)
+    else:
+        padding_size = 0
+
+    # Write the padding size as a single byte
+    output += padding_size.to_bytes(1, 'big')
+
+    # Write the encoded data (padded to the next multiple of 8 bits)
+    output += int(encoded_data, 2).to_bytes((len(encoded_data) + padding_size) // 8, 'big')
+
+    return bytes(output)
+
+
+def huffman_compress(input_file_path, output_file_path):
+    with open(input_file_path, 'rb') as f:
+        data = f.read()
+
+    with open(output_file_path, 'wb') as f:
+        f.write(huffman_encode_bytes(data))
+
+
+# Step 2: Decompression (Restoring the Original Data)
+def huffman_decode_bytes(compressed):
+    """Decode a bytes object produced by huffman_encode_bytes."""
+    position = 0
+
+    # Read the length of the dictionary
+    dict_size = int.from_bytes(compressed[position:position + 4], 'big')
+    position += 4
+
+    # Read the dictionary
+    decoding_tree = {}
+    for _ in range(dict_size):
+        char = compressed[position]
+        code_length = compressed[position + 1]
+        position += 2
+        code_bits = compressed[position:position + (code_length + 7) // 8]
+        position += (code_length + 7) // 8
+        code = bin(int.from_bytes(code_bits, 'big'))[2:].zfill(code_length)  # Convert to binary string
+        decoding_tree[code] = char
+
+    padding_size = compressed[position]
+    position += 1
+
+    # Read the encoded data
+    encoded_data = compressed[position:]
+
+    # Decode the encoded data
+    global _byte_bits
+    if _byte_bits is None:
+        _byte_bits = [bin(byte)[2:].zfill(8) for byte in range(256)]
+    bit_str = ''.join([_byte_bits[byte] for byte in encoded_data])
+    bit_str = bit_str[padding_size:]
+
+    decoded_data = bytearray()  # Use a bytearray to store the decoded binary data
+    current_code = ""
+    for bit in bit_str:
+        current_code += bit
+        if current_code in decoding_tree:
+            decoded_data.append(decoding_tree[current_code])  # Add the decoded byte value
+            current_code = ""
+
+    return bytes(decoded_data)
+
+
+def huffman_decompress(input_file_path, output_file_path):
+    with open(input_file_path, 'rb') as f:
+        compressed = f.read()
+
+    # Write the decoded data to the output file
+    with open(output_file_path, 'wb') as f:
+        f.write(huffman_decode_bytes(compressed))  # Write the raw binary data directly
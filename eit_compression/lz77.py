@@ -1,9 +1,3 @@
-import math
-import time
-from bitarray import bitarray
-import os
-
-
 class LZ77Compressor:
     """
     A simplified implementation of the LZ77 Compression Algorithm
@@ -31,8 +25,6 @@ class LZ77Compressor:
         if verbose is enabled, the compression description is printed to standard output
         """
         data = None
-        i = 0
-        output_buffer = bitarray(endian='big')
 
         # read the input file
         try:
@@ -42,6 +34,63 @@ class LZ77Compressor:
             print('Could not open input file ...')
             raise
 
+        output_buffer = self.encode(data, verbose=verbose)
+
+        # write the compressed data into a binary file if a path is provided
+        if output_file_path:
+            try:
+                with open(output_file_path, 'wb') as output_file:
+                    output_file.write(output_buffer.tobytes())
+                    print("File was compressed successfully and saved to output path ...")
+                    return None
+            except IOError:
+                print('Could not write to output file path. Please check if the path is correct ...')
+                raise
+
+        # an output file path was not provided, return the compressed data
+        return output_buffer
+
+    def decompress(self, input_file_path, output_file_path=None):
+        """
+        Given a string of the compressed file path, the data is decompressed back to its
+        original form, and written into the output file path if provided. If no output
+        file path is provided, the decompressed data is returned as a string
+        """
+        from bitarray import bitarray
+
+        data = bitarray(endian='big')
+
+        # read the input file
+        try:
+            with open(input_file_path, 'rb') as input_file:
+                data.fromfile(input_file)
+        except IOError:
+            print('Could not open input file ...')
+            raise
+
+        out_data = self.decode(data)
+
+        if output_file_path:
+            try:
+                with open(output_file_path, 'wb') as output_file:
+                    output_file.write(out_data)
+                    print('File was decompressed successfully and saved to output path ...')
+                    return None
+            except IOError:
+                print('Could not write to output file path. Please check if the path is correct ...')
+                raise
+        return out_data
+
+    def encode(self, data, verbose=False):
+        """
+        Compresses the given bytes object and returns the compressed bits as a
+        bitarray, in the format described in compress
+        """
+        from bitarray import bitarray
+
+        i = 0
+        output_buffer = bitarray(endian='big')
+
         while i < len(data):
             # print(i)
 
@@ -74,37 +123,15 @@ class LZ77Compressor:
         # fill the buffer with zeros if the number of bits is not a multiple of 8
         output_buffer.fill()
 
-        # write the compressed data into a binary file if a path is provided
-        if output_file_path:
-            try:
-                with open(output_file_path, 'wb') as output_file:
-                    output_file.write(output_buffer.tobytes())
-                    print("File was compressed successfully and saved to output path ...")
-                    return None
-            except IOError:
-                print('Could not write to output file path. Please check if the path is correct ...')
-                raise
-
-        # an output file path was not provided, return the compressed data
         return output_buffer
 
-    def decompress(self, input_file_path, output_file_path=None):
+    def decode(self, data):
         """
-        Given a string of the compressed file path, the data is decompressed back to its
-        original form, and written into the output file path if provided. If no output
-        file path is provided, the decompressed data is returned as a string
+        Decompresses the given bitarray back to the original bytes. The bitarray is
+        consumed in the process
         """
-        data = bitarray(endian='big')
         output_buffer = []
 
-        # read the input file
-        try:
-            with open(input_file_path, 'rb') as input_file:
-                data.fromfile(input_file)
-        except IOError:
-            print('Could not open input file ...')
-            raise
-
         while len(data) >= 9:
 
             flag = data.pop(0)
@@ -124,18 +151,23 @@ class LZ77Compressor:
 
                 for i in range(length):
                     output_buffer.append(output_buffer[-distance])
-        out_data = b''.join(output_buffer)
+        return b''.join(output_buffer)
 
-        if output_file_path:
-            try:
-                with open(output_file_path, 'wb') as output_file:
-                    output_file.write(out_data)
-                    print('File was decompressed successfully and saved to output path ...')
-                    return None
-            except IOError:
-                print('Could not write to output file path. Please check if the path is correct ...')
-                raise
-        return out_data
+    def compress_bytes(self, data):
+        """
+        Compresses the given bytes object and returns the compressed bytes
+        """
+        return self.encode(data).tobytes()
+
+    def decompress_bytes(self, data):
+        """
+        Decompresses the given compressed bytes and returns the original bytes
+        """
+        from bitarray import bitarray
+
+        bits = bitarray(endian='big')
+        bits.frombytes(data)
+        return self.decode(bits)
 
     def findLongestMatch(self, data, current_position):
         """
@@ -178,25 +210,24 @@ if __name__ == "__main__":
     import os
     import time
 
+    from .seekable import seekable_compress, seekable_verify
+
     MIN_FILE = 1
     MAX_FILE = 5
     RANGE = range(MIN_FILE, MAX_FILE)
 
     input_files = [f"Samp{i}.bin" for i in RANGE]
     compressed_files = [f"compressed_Samp{i}.bin" for i in RANGE]
-    decompressed_files = [f"decompressed_Samp{i}.bin" for i in RANGE]
 
-    lz77 = LZ77Compressor(window_size=64, lookahead=8)
-
-    # Compress and decompress the files
-    for i, (input_file, compressed_file, decompressed_file) in enumerate(zip(input_files, compressed_files, decompressed_files)):
+    # Compress the files into the checksummed container and verify them in place
+    for i, (input_file, compressed_file) in enumerate(zip(input_files, compressed_files)):
         print(f"Processing file {i+1}...")
 
         try:
             # Compress the file
             print(f"Compressing {input_file}...")
             start_time = time.time()
-            lz77.compress(input_file, compressed_file, verbose=False)
+            seekable_compress(input_file, compressed_file, codec='lz77')
             end_time = time.time()
 
             # Calculate compression ratio
@@ -209,17 +240,10 @@ if __name__ == "__main__":
             print(f"Compression ratio: {compression_ratio:.2f}")
             print(f"Compression time: {end_time - start_time:.2f} seconds")
 
-            # Decompress the file
-            print(f"Decompressing {compressed_file}...")
-            lz77.decompress(compressed_file, decompressed_file)
-
-            # Verify the decompressed file matches the original
-            with open(input_file, 'rb') as original, open(decompressed_file, 'rb') as decompressed:
-                if original.read() == decompressed.read():
-                    print(f"File {i+1} successfully verified! The decompressed file matches the original.")
-                else:
-                    print(f"File {i+1} verification failed! The decompressed file does not match the original.")
+            # Verify the checksums without writing the decompressed file
+            print(f"Verifying {compressed_file}...")
+            seekable_verify(compressed_file)
+            print(f"File {i+1} successfully verified! All block and stream checksums match.")
 
         except Exception as e:
             print(f"An error occurred with file {i+1}: {e}")
-
@@ -0,0 +1,292 @@
+class ExtendedLZ77Compressor:
+    """
+    An LZ77 variant with wide distance and length fields, for windows of up to 16 MB
+    and matches of any length.
+
+    Matches are found with a binary tree match finder, the one used by LZMA's bt
+    modes. Every position of the window is a node in a binary search tree ordered by
+    the bytes that follow it, with one tree per 3 byte prefix. Inserting a position
+    walks down its tree and yields the longest match on the way, so a lookup costs
+    about the depth of the tree instead of the size of the window. The walk is
+    bounded by max_depth, which keeps the speed steady as the window grows.
+    """
+    MIN_MATCH = 4
+    MAX_WINDOW_SIZE = 1 << 24  # distances are stored in 3 bytes
+    HASH_BYTES = 3
+
+    def __init__(self, window_size=1 << 20, max_match=258, max_depth=32):
+        self.window_size = min(window_size, self.MAX_WINDOW_SIZE)
+        self.max_match = max(max_match, self.MIN_MATCH)
+        self.max_depth = max_depth
+
+    def compress(self, input_file_path, output_file_path=None, verbose=False):
+        """
+        Given the path of an input file, its content is compressed with the extended
+        LZ77 format.
+
+        The compressed format is a sequence of groups, each made of a flag byte
+        followed by up to 8 tokens. The bits of the flag byte, most significant
+        first, tell the kind of each token:
+        0 - a literal, 1 byte
+        1 - a match, 3 bytes of distance - 1 followed by 1 byte of length - 4. A
+            length byte of 255 is followed by more length bytes that are added to it,
+            until a byte below 255
+
+        If a path to the output file is provided, the compressed data is written into
+        a binary file. Otherwise, it is returned as bytes
+
+        if verbose is enabled, the compression description is printed to standard output
+        """
+        try:
+            with open(input_file_path, 'rb') as input_file:
+                data = input_file.read()
+        except IOError:
+            print('Could not open input file ...')
+            raise
+
+        output = self.compress_bytes(data, verbose=verbose)
+
+        if output_file_path:
+            try:
+                with open(output_file_path, 'wb') as output_file:
+                    output_file.write(output)
+                    print("File was compressed successfully and saved to output path ...")
+                    return None
+            except IOError:
+                print('Could not write to output file path. Please check if the path is correct ...')
+                raise
+
+        return output
+
+    def decompress(self, input_file_path, output_file_path=None):
+        """
+        Given a string of the compressed file path, the data is decompressed back to its
+        original form, and written into the output file path if provided. If no output
+        file path is provided, the decompressed data is returned as bytes
+        """
+        try:
+            with open(input_file_path, 'rb') as input_file:
+                data = input_file.read()
+        except IOError:
+            print('Could not open input file ...')
+            raise
+
+        out_data = self.decompress_bytes(data)
+
+        if output_file_path:
+            try:
+                with open(output_file_path, 'wb') as output_file:
+                    output_file.write(out_data)
+                    print('File was decompressed successfully and saved to output path ...')
+                    return None
+            except IOError:
+                print('Could not write to output file path. Please check if the path is correct ...')
+                raise
+        return out_data
+
+    def compress_bytes(self, data, verbose=False):
+        """
+        Compresses the given bytes object and returns the compressed bytes
+        """
+        output = bytearray()
+        flag_position = 0
+        token_count = 8
+
+        # The binary tree lives in a cyclic buffer with two children per position
+        cyclic_size = min(self.window_size, len(data)) + 1
+        children = [-1] * (2 * cyclic_size)
+        heads = {}
+
+        i = 0
+        while i < len(data):
+            if token_count == 8:
+                flag_position = len(output)
+                output.append(0)
+                token_count = 0
+
+            best_length, best_distance = self._insert_position(data, i, children, cyclic_size, heads)
+
+            if best_length >= self.MIN_MATCH:
+                output[flag_position] |= 0x80 >> token_count
+                output += (best_distance - 1).to_bytes(3, 'big')
+                extra_length = best_length - self.MIN_MATCH
+                while extra_length >= 255:
+                    output.append(255)
+                    extra_length -= 255
+                output.append(extra_length)
+
+                if verbose:
+                    print("<1, %i, %i>" % (best_distance, best_length), end='')
+
+                # The skipped positions still have to be added to the tree
+                for position in range(i + 1, i + best_length):
+                    self._insert_position(data, position, children, cyclic_size, heads)
+                i += best_length
+
+            else:
+                output.append(data[i])
+
+                if verbose:
+                    print("<0, %s>" % data[i], end='')
+
+                i += 1
+
+            token_count += 1
+
+        return bytes(output)
+
+    def decompress_bytes(self, data):
+        """
+        Decompresses the given compressed bytes and returns the original bytes
+        """
+        output = bytearray()
+        position = 0
+        flags = 0
+        token_count = 8
+
+        while position < len(data):
+            if token_count == 8:
+                flags = data[position]
+                position += 1
+                token_count = 0
+                continue
+
+            if flags & (0x80 >> token_count):
+                distance = int.from_bytes(data[position:position + 3], 'big') + 1
+                position += 3
+                length = self.MIN_MATCH
+                while data[position] == 255:
+                    length += 255
+                    position += 1
+                length += data[position]
+                position += 1
+
+                start = len(output) - distance
+                if distance >= length:
+                    output += output[start:start + length]
+                else:
+                    # The match overlaps the bytes it produces, repeat the period
+                    period = output[start:]
+                    output += (period * (length // distance + 1))[:length]
+            else:
+                output.append(data[position])
+                position += 1
+
+            token_count += 1
+
+        return bytes(output)
+
+    def _insert_position(self, data, current_position, children, cyclic_size, heads):
+        """
+        Inserts current_position into the binary tree of its 3 byte prefix and returns
+        the (length, distance) of the longest match met on the way down, or (0, 0)
+        """
+        if current_position + self.HASH_BYTES > len(data):
+            return 0, 0
+
+        max_length = min(self.max_match, len(data) - current_position)
+        key = data[current_position:current_position + self.HASH_BYTES]
+        match_position = heads.get(key, -1)
+        heads[key] = current_position
+
+        # left_slot and right_slot are where the next smaller and greater nodes get linked
+        node = 2 * (current_position % cyclic_size)
+        left_slot = node
+        right_slot = node + 1
+        left_length = right_length = 0
+        best_length = best_distance = 0
+
+        depth = self.max_depth
+        while True:
+            distance = current_position - match_position
+            if match_position < 0 or distance >= cyclic_size or depth == 0:
+                children[left_slot] = children[right_slot] = -1
+                break
+            depth -= 1
+
+            # Both neighbours already share min(left_length, right_length) bytes with us
+            length = self._common_length(data, match_position, current_position,
+                                         min(left_length, right_length), max_length)
+
+            pair = 2 * (match_position % cyclic_size)
+            if length > best_length:
+                best_length = length
+                best_distance = distance
+            if length == max_length:
+                # The new position replaces this node, which takes over its children
+                children[left_slot] = children[pair]
+                children[right_slot] = children[pair + 1]
+                break
+
+            if data[match_position + length] < data[current_position + length]:
+                children[left_slot] = match_position
+                left_slot = pair + 1
+                match_position = children[left_slot]
+                left_length = length
+            else:
+                children[right_slot] = match_position
+                right_slot = pair
+                match_position = children[right_slot]
+                right_length = length
+
+        return best_length, best_distance
+
+    @staticmethod
+    def _common_length(data, match_position, current_position, length, max_length):
+        """
+        Returns how many bytes the two positions share, up to max_length, knowing that
+        the first length bytes are already equal. Slices are compared before single
+        bytes since long matches are the common case in repetitive data
+        """
+        if data[match_position + length:match_position + max_length] == \
+                data[current_position + length:current_position + max_length]:
+            return max_length
+        while length + 16 <= max_length and data[match_position + length:match_position + length + 16] == \
+                data[current_position + length:current_position + length + 16]:
+            length += 16
+        while length < max_length and data[match_position + length] == data[current_position + length]:
+            length += 1
+        return length
+
+
+if __name__ == "__main__":
+    import os
+    import time
+
+    from .seekable import seekable_compress, seekable_verify
+
+    MIN_FILE = 1
+    MAX_FILE = 5
+    RANGE = range(MIN_FILE, MAX_FILE)
+
+    input_files = [f"Samp{i}.bin" for i in RANGE]
+    compressed_files = [f"compressed_Samp{i}.bin" for i in RANGE]
+
+    # Compress the files into the checksummed container and verify them in place
+    for i, (input_file, compressed_file) in enumerate(zip(input_files, compressed_files)):
+        print(f"Processing file {i+1}...")
+
+        try:
+            # Compress the file
+            print(f"Compressing {input_file}...")
+            start_time = time.time()
+            seekable_compress(input_file, compressed_file, codec='lz77_extended')
+            end_time = time.time()
+
+            # Calculate compression ratio
+            original_size = os.path.getsize(input_file)
+            compressed_size = os.path.getsize(compressed_file)
+            compression_ratio = compressed_size / original_size if original_size > 0 else float('inf')
+
+            print(f"\nOriginal size: {original_size} bytes")
+            print(f"Compressed size: {compressed_size} bytes")
+            print(f"Compression ratio: {compression_ratio:.2f}")
+            print(f"Compression time: {end_time - start_time:.2f} seconds")
+
+            # Verify the checksums without writing the decompressed file
+            print(f"Verifying {compressed_file}...")
+            seekable_verify(compressed_file)
+            print(f"File {i+1} successfully verified! All block and stream checksums match.")
+
+        except Exception as e:
+            print(f"An error occurred with file {i+1}: {e}")
@@ -1,7 +1,5 @@
 import os
 import time
-from bitarray import bitarray
-import pickle
 
 
 class LZ78Compressor:
@@ -17,6 +15,9 @@ class LZ78Compressor:
         """
         Compresses the file using LZ78.
         """
+        from bitarray import bitarray
+        import pickle
+
         # Read the input file
         try:
             with open(input_file_path, 'rb') as input_file:
@@ -68,6 +69,8 @@ class LZ78Compressor:
         """
         Decompresses a file compressed with LZ78.
         """
+        import pickle
+
         try:
             with open(input_file_path, 'rb') as input_file:
                 encoded_data = pickle.load(input_file)
@@ -2,11 +2,8 @@ import os
 import time
 
 
-def lz78_compress(input_file_path, output_file_path):
-    """Compress a file using the LZ78 algorithm."""
-    with open(input_file_path, 'rb') as f:
-        data = f.read()
-
+def lz78_encode_bytes(data):
+    """Encode a bytes object using the LZ78 algorithm."""
     dictionary = {}
     next_code = 1
     current_string = b""
@@ -29,32 +26,33 @@ def lz78_compress(input_file_path, output_file_path):
         prefix = current_string[:-1]
         compressed_data.append((dictionary.get(prefix, 0), current_string[-1]))
 
-    # Write the compressed data to a file
-    with open(output_file_path, 'wb') as f:
-        for index, byte in compressed_data:
-            f.write(index.to_bytes(2, 'big'))  # Write index (2 bytes)
-            f.write(bytes([byte]))  # Write the next character
+    output = bytearray()
+    for index, byte in compressed_data:
+        output += index.to_bytes(2, 'big')  # Write index (2 bytes)
+        output.append(byte)  # Write the next character
+    return bytes(output)
 
 
-def lz78_decompress(input_file_path, output_file_path):
-    """Decompress a file using the LZ78 algorithm."""
+def lz78_compress(input_file_path, output_file_path):
+    """Compress a file using the LZ78 algorithm."""
     with open(input_file_path, 'rb') as f:
-        compressed_data = []
-        while True:
-            index_bytes = f.read(2)
-            if not index_bytes:
-                break
-            index = int.from_bytes(index_bytes, 'big')
-            byte = f.read(1)
-            if not byte:
-                break
-            compressed_data.append((index, byte[0]))
+        data = f.read()
+
+    # Write the compressed data to a file
+    with open(output_file_path, 'wb') as f:
+        f.write(lz78_encode_bytes(data))
+
 
+def lz78_decode_bytes(compressed):
+    """Decode a bytes object produced by lz78_encode_bytes."""
     dictionary = {}
     next_code = 1
     decompressed_data = bytearray()
 
-    for index, byte in compressed_data:
+    # Each entry is a 2 byte index followed by the next character
+    for position in range(0, len(compressed) - 2, 3):
+        index = int.from_bytes(compressed[position:position + 2], 'big')
+        byte = compressed[position + 2]
         if index == 0:
             current_string = bytes([byte])
         else:
@@ -63,6 +61,14 @@ def lz78_decompress(input_file_path, output_file_path):
         dictionary[next_code] = current_string
         next_code += 1
 
+    return bytes(decompressed_data)
+
+
+def lz78_decompress(input_file_path, output_file_path):
+    """Decompress a file using the LZ78 algorithm."""
+    with open(input_file_path, 'rb') as f:
+        compressed = f.read()
+
     # Write the decompressed data to a file
     with open(output_file_path, 'wb') as f:
-        f.write(decompressed_data)
+        f.write(lz78_decode_bytes(compressed))
@@ -0,0 +1,163 @@
+import os
+import time
+
+# bzip2 style zero run symbols. A run of n zeros is written as n in bijective base 2,
+# least significant digit first, where RUNA is worth 1 and RUNB is worth 2. Every
+# non-zero value v is shifted to v + 1, so an alphabet of k values stays k + 1 symbols.
+RUNA = 0
+RUNB = 1
+
+# Longest run stored in a single (byte, count) pair of the byte-level format
+MAX_RUN = 255
+
+
+def run_length_encoding(values):
+    """
+    Run-Length Encoding. Returns the symbol of each run and its length as two arrays,
+    with run boundaries found by a vectorized comparison of neighbors. Works for any
+    symbols numpy can compare for equality, not only numbers.
+    """
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.size == 0:
+        return values[:0], np.zeros(0, dtype=np.int64)
+
+    starts = np.concatenate(([0], np.flatnonzero(values[1:] != values[:-1]) + 1))
+    lengths = np.diff(np.append(starts, values.size))
+    return values[starts], lengths
+
+
+def run_length_decoding(symbols, lengths):
+    """Inverse of run_length_encoding."""
+    import numpy as np
+
+    return np.repeat(np.asarray(symbols), np.asarray(lengths))
+
+
+def zero_run_encoding(mtf_values):
+    """
+    Encodes Move-to-Front output with RUNA/RUNB zero runs. Zero runs become their
+    bijective base 2 digits and non-zero values v become v + 1.
+    """
+    import numpy as np
+
+    symbols, lengths = run_length_encoding(np.asarray(mtf_values, dtype=np.int64))
+    if symbols.size == 0:
+        return symbols
+
+    is_zero_run = symbols == 0
+
+    # A zero run of length n takes floor(log2(n + 1)) digits, which are the bits of
+    # n + 1 below its leading one. Other runs emit one symbol per value.
+    digit_counts = np.frexp(lengths + 1)[1] - 1
+    output_lengths = np.where(is_zero_run, digit_counts, lengths)
+
+    run_ids = np.repeat(np.arange(symbols.size), output_lengths)
+    run_starts = np.cumsum(output_lengths) - output_lengths
+    digit_positions = np.arange(run_ids.size) - run_starts[run_ids]
+
+    zero_digits = ((lengths[run_ids] + 1) >> digit_positions) & 1
+    return np.where(is_zero_run[run_ids], zero_digits, symbols[run_ids] + 1)
+
+
+def zero_run_decoding(encoded):
+    """Inverse of zero_run_encoding."""
+    import numpy as np
+
+    encoded = np.asarray(encoded, dtype=np.int64)
+    if encoded.size == 0:
+        return encoded
+
+    # Consecutive RUNA/RUNB digits form a single zero run
+    is_digit = encoded <= RUNB
+    is_group_start = is_digit & ~np.concatenate(([False], is_digit[:-1]))
+    group_starts = np.flatnonzero(is_group_start)
+
+    digit_indices = np.flatnonzero(is_digit)
+    group_ids = np.cumsum(is_group_start)[digit_indices] - 1
+    digit_positions = digit_indices - group_starts[group_ids]
+    zero_run_lengths = np.zeros(group_starts.size, dtype=np.int64)
+    np.add.at(zero_run_lengths, group_ids, (encoded[digit_indices] + 1) << digit_positions)
+
+    # Every non-zero symbol becomes one value, every digit group becomes one run of zeros
+    token_positions = np.flatnonzero(~is_digit | is_group_start)
+    token_is_run = is_digit[token_positions]
+    token_values = np.where(token_is_run, 0, encoded[token_positions] - 1)
+    token_lengths = np.ones(token_positions.size, dtype=np.int64)
+    token_lengths[token_is_run] = zero_run_lengths
+    return np.repeat(token_values, token_lengths)
+
+
+def rle_encode_bytes(data):
+    """
+    Encodes a bytes object as (byte, count) pairs with counts between 1 and 255.
+    Longer runs are split into several pairs.
+    """
+    import numpy as np
+
+    symbols, lengths = run_length_encoding(np.frombuffer(data, dtype=np.uint8))
+    if symbols.size == 0:
+        return b''
+
+    pieces = (lengths + MAX_RUN - 1) // MAX_RUN
+    split_symbols = np.repeat(symbols, pieces)
+    split_lengths = np.full(split_symbols.size, MAX_RUN, dtype=np.int64)
+    split_lengths[np.cumsum(pieces) - 1] = lengths - MAX_RUN * (pieces - 1)
+
+    return np.column_stack((split_symbols, split_lengths)).astype(np.uint8).tobytes()
+
+
+def rle_decode_bytes(compressed):
+    """Inverse of rle_encode_bytes."""
+    import numpy as np
+
+    pairs = np.frombuffer(compressed, dtype=np.uint8).reshape(-1, 2)
+    return run_length_decoding(pairs[:, 0], pairs[:, 1]).tobytes()
+
+
+def rle_compress(input_file_path, output_file_path):
+    """Run-length encode a file, useful as a fast pre-pass for highly repetitive inputs."""
+    with open(input_file_path, 'rb') as f:
+        data = f.read()
+
+    with open(output_file_path, 'wb') as f:
+        f.write(rle_encode_bytes(data))
+
+
+def rle_decompress(input_file_path, output_file_path):
+    """Decompress a file produced by rle_compress."""
+    with open(input_file_path, 'rb') as f:
+        compressed = f.read()
+
+    with open(output_file_path, 'wb') as f:
+        f.write(rle_decode_bytes(compressed))
+
+
+if __name__ == "__main__":
+    from .seekable import seekable_compress, seekable_verify
+
+    RANGE = range(1, 5)
+    input_files = [f"Samp{i}.bin" for i in RANGE]
+    compressed_files = [f"rle_Samp{i}.bin" for i in RANGE]
+
+    # Compress the files into the checksummed container and verify them in place
+    for i, (input_file, compressed_file) in enumerate(zip(input_files, compressed_files)):
+        print(f"Processing file {i + 1}...")
+
+        start_time = time.time()
+        seekable_compress(input_file, compressed_file, codec='rle')
+        end_time = time.time()
+
+        original_size = os.path.getsize(input_file)
+        compressed_size = os.path.getsize(compressed_file)
+        compression_ratio = compressed_size / original_size if original_size > 0 else float('inf')
+        print(f"Compression ratio: {compression_ratio:.3f}")
+        print(f"Compression time: {end_time - start_time:.4f} seconds")
+
+        # Verify the checksums without writing the decompressed file
+        try:
+            seekable_verify(compressed_file)
+            print(f"File {i + 1} successfully verified! All block and stream checksums match.")
+        except ValueError as e:
+            print(f"File {i + 1} verification failed! {e}")
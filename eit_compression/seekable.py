@@ -0,0 +1,397 @@
+import io
+import os
+import time
+import zlib
+from collections import OrderedDict
+
+from .huffman import huffman_encode_bytes, huffman_decode_bytes
+from .lz88_adam import lz78_encode_bytes, lz78_decode_bytes
+
+# The seekable container splits the input into fixed size blocks and compresses every
+# block independently, so any byte range can be read back by decoding only the blocks
+# that cover it. Every block carries a CRC32 of its uncompressed bytes and the footer
+# carries a CRC32 of the whole stream, so corruption is caught while decoding.
+#
+# Layout:
+#   header  - magic (4 bytes), version (1 byte), codec id (1 byte), block size (4 bytes)
+#   blocks  - the compressed payloads, back to back
+#   index   - one entry per block: uncompressed offset (8 bytes), compressed offset
+#             (8 bytes), uncompressed size (4 bytes), compressed size (4 bytes),
+#             method (1 byte), CRC32 of the uncompressed block (4 bytes)
+#   footer  - index offset (8 bytes), block count (4 bytes), CRC32 of the whole
+#             uncompressed stream (4 bytes), magic (4 bytes)
+MAGIC = b'EITS'
+FOOTER_MAGIC = b'EITX'
+VERSION = 2
+HEADER_SIZE = 10
+INDEX_ENTRY_SIZE = 29
+FOOTER_SIZE = 20
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+# Block methods, a block is stored raw whenever the codec does not make it smaller
+STORED = 0
+CODECS = {
+    'huffman': 1,
+    'lz78': 2,
+    'lz77': 3,
+    'rle': 4,
+    'lz77_extended': 5,
+}
+
+# LZ78 indices are 2 bytes, which is only enough for blocks of up to 64 KB
+LZ78_MAX_BLOCK_SIZE = 1 << 16
+
+# Every block is compressed on its own, so a match can never reach further back than
+# the start of its block. The extended LZ77 codec exists for long distance matches,
+# so it defaults to blocks as large as its 1 MB window.
+CODEC_BLOCK_SIZES = {
+    'lz77_extended': 1 << 20,
+}
+
+
+def _encode_block(method, data):
+    if method == CODECS['huffman']:
+        return huffman_encode_bytes(data)
+    if method == CODECS['lz78']:
+        return lz78_encode_bytes(data)
+    if method == CODECS['lz77']:
+        # bitarray is only needed for this codec
+        from .lz77 import LZ77Compressor
+        return LZ77Compressor(window_size=64, lookahead=8).compress_bytes(data)
+    if method == CODECS['rle']:
+        # numpy is only needed for this codec
+        from .rle import rle_encode_bytes
+        return rle_encode_bytes(data)
+    if method == CODECS['lz77_extended']:
+        from .lz77_extended import ExtendedLZ77Compressor
+        return ExtendedLZ77Compressor().compress_bytes(data)
+    raise ValueError(f"Unknown block method {method}")
+
+
+def _decode_block(method, payload):
+    if method == STORED:
+        return payload
+    if method == CODECS['huffman']:
+        return huffman_decode_bytes(payload)
+    if method == CODECS['lz78']:
+        return lz78_decode_bytes(payload)
+    if method == CODECS['lz77']:
+        from .lz77 import LZ77Compressor
+        return LZ77Compressor().decompress_bytes(payload)
+    if method == CODECS['rle']:
+        from .rle import rle_decode_bytes
+        return rle_decode_bytes(payload)
+    if method == CODECS['lz77_extended']:
+        from .lz77_extended import ExtendedLZ77Compressor
+        return ExtendedLZ77Compressor().decompress_bytes(payload)
+    raise ValueError(f"Unknown block method {method}")
+
+
+def seekable_compress(input_file_path, output_file_path, codec='huffman', block_size=None):
+    """
+    Compress a file into the seekable block container using the given codec.
+
+    block_size defaults to DEFAULT_BLOCK_SIZE, or to the codec's entry in
+    CODEC_BLOCK_SIZES. Matches never cross blocks, so smaller blocks trade ratio for
+    cheaper random reads.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec {codec!r}, expected one of {sorted(CODECS)}")
+    codec_id = CODECS[codec]
+    if block_size is None:
+        block_size = CODEC_BLOCK_SIZES.get(codec, DEFAULT_BLOCK_SIZE)
+    if not 0 < block_size < 1 << 32:
+        raise ValueError(f"block_size must be between 1 and {(1 << 32) - 1}, got {block_size}")
+    if codec == 'lz78' and block_size > LZ78_MAX_BLOCK_SIZE:
+        raise ValueError(f"The lz78 codec supports blocks of at most {LZ78_MAX_BLOCK_SIZE} bytes, got {block_size}")
+
+    index = []
+    stream_checksum = 0
+    with open(input_file_path, 'rb') as f_in, open(output_file_path, 'wb') as f_out:
+        f_out.write(MAGIC)
+        f_out.write(VERSION.to_bytes(1, 'big'))
+        f_out.write(codec_id.to_bytes(1, 'big'))
+        f_out.write(block_size.to_bytes(4, 'big'))
+
+        uncompressed_offset = 0
+        compressed_offset = HEADER_SIZE
+        while True:
+            block = f_in.read(block_size)
+            if not block:
+                break
+
+            checksum = zlib.crc32(block)
+            stream_checksum = zlib.crc32(block, stream_checksum)
+
+            method = codec_id
+            payload = _encode_block(method, block)
+            if len(payload) >= len(block):
+                method = STORED
+                payload = block
+
+            f_out.write(payload)
+            index.append((uncompressed_offset, compressed_offset, len(block), len(payload), method, checksum))
+            uncompressed_offset += len(block)
+            compressed_offset += len(payload)
+
+        # Write the offset index followed by the footer pointing at it
+        for entry in index:
+            f_out.write(_pack_index_entry(entry))
+        f_out.write(compressed_offset.to_bytes(8, 'big'))
+        f_out.write(len(index).to_bytes(4, 'big'))
+        f_out.write(stream_checksum.to_bytes(4, 'big'))
+        f_out.write(FOOTER_MAGIC)
+
+
+def seekable_decompress(input_file_path, output_file_path):
+    """
+    Decompress a whole seekable container back to the original file, one block at a
+    time. Checksums are verified as the blocks are decoded and a ValueError is raised
+    on the first mismatch.
+    """
+    with SeekableReader(input_file_path, cache_size=0) as reader, open(output_file_path, 'wb') as f_out:
+        for block in reader.iter_blocks():
+            f_out.write(block)
+
+
+def seekable_verify(input_file_path):
+    """
+    Check the integrity of a seekable container by decoding every block and comparing
+    the block and stream checksums, without writing any output. Memory use is bounded
+    by a single block. Raises a ValueError describing the first mismatch.
+    """
+    with SeekableReader(input_file_path, cache_size=0) as reader:
+        for _ in reader.iter_blocks():
+            pass
+
+
+def seekable_read(input_file_path, offset, length):
+    """Read length uncompressed bytes starting at offset from a seekable container."""
+    with SeekableReader(input_file_path) as reader:
+        return reader.pread(offset, length)
+
+
+def _pack_index_entry(entry):
+    uncompressed_offset, compressed_offset, uncompressed_size, compressed_size, method, checksum = entry
+    return (uncompressed_offset.to_bytes(8, 'big') + compressed_offset.to_bytes(8, 'big')
+            + uncompressed_size.to_bytes(4, 'big') + compressed_size.to_bytes(4, 'big')
+            + method.to_bytes(1, 'big') + checksum.to_bytes(4, 'big'))
+
+
+def _unpack_index_entry(raw):
+    return (int.from_bytes(raw[0:8], 'big'), int.from_bytes(raw[8:16], 'big'),
+            int.from_bytes(raw[16:20], 'big'), int.from_bytes(raw[20:24], 'big'), raw[24],
+            int.from_bytes(raw[25:29], 'big'))
+
+
+class SeekableReader(io.RawIOBase):
+    """
+    A read-only file-like view of the uncompressed contents of a seekable container.
+    It is a raw binary stream, so it can be wrapped by io.BufferedReader or
+    io.TextIOWrapper.
+
+    Only the blocks covering the requested range are read and decoded, and the most
+    recently decoded blocks are kept in an LRU cache of cache_size entries.
+    """
+
+    def __init__(self, input_file_path, cache_size=8):
+        super().__init__()
+        self.file = None
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.position = 0
+        self.file = open(input_file_path, 'rb')
+
+        try:
+            header = self.file.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE or header[:4] != MAGIC:
+                raise ValueError(f"{input_file_path} is not a seekable container")
+            if header[4] != VERSION:
+                raise ValueError(f"Unsupported container version {header[4]}")
+            self.block_size = int.from_bytes(header[6:10], 'big')
+            if self.block_size == 0:
+                raise ValueError(f"{input_file_path} has an invalid block size of 0")
+
+            if os.fstat(self.file.fileno()).st_size < HEADER_SIZE + FOOTER_SIZE:
+                raise ValueError(f"{input_file_path} is truncated, the index footer is missing")
+            self.file.seek(-FOOTER_SIZE, os.SEEK_END)
+            footer = self.file.read(FOOTER_SIZE)
+            if footer[16:] != FOOTER_MAGIC:
+                raise ValueError(f"{input_file_path} has a missing or corrupt index footer")
+            index_offset = int.from_bytes(footer[0:8], 'big')
+            block_count = int.from_bytes(footer[8:12], 'big')
+            self.stream_checksum = int.from_bytes(footer[12:16], 'big')
+
+            self.file.seek(index_offset)
+            raw_index = self.file.read(block_count * INDEX_ENTRY_SIZE)
+            if len(raw_index) != block_count * INDEX_ENTRY_SIZE:
+                raise ValueError(f"{input_file_path} has a truncated block index")
+            self.index = [_unpack_index_entry(raw_index[i:i + INDEX_ENTRY_SIZE])
+                          for i in range(0, len(raw_index), INDEX_ENTRY_SIZE)]
+            self._check_index(input_file_path, index_offset)
+        except Exception:
+            self.file.close()
+            raise
+
+        if self.index:
+            last_offset, _, last_size, _, _, _ = self.index[-1]
+            self.size = last_offset + last_size
+        else:
+            self.size = 0
+
+    def _check_index(self, input_file_path, index_offset):
+        """
+        The offsets in the index are not covered by the checksums, so make sure the
+        blocks are contiguous and that every block but the last holds block_size bytes,
+        which is what pread relies on to find blocks.
+        """
+        expected_uncompressed_offset = 0
+        expected_compressed_offset = HEADER_SIZE
+        for block_number, entry in enumerate(self.index):
+            uncompressed_offset, compressed_offset, uncompressed_size, compressed_size, _, _ = entry
+            if uncompressed_offset != expected_uncompressed_offset or compressed_offset != expected_compressed_offset:
+                raise ValueError(f"{input_file_path} has a corrupt index entry for block {block_number}")
+            is_last = block_number == len(self.index) - 1
+            if uncompressed_size != self.block_size and not (is_last and 0 < uncompressed_size < self.block_size):
+                raise ValueError(f"{input_file_path} has an invalid size for block {block_number}")
+            expected_uncompressed_offset += uncompressed_size
+            expected_compressed_offset += compressed_size
+
+        if expected_compressed_offset != index_offset:
+            raise ValueError(f"{input_file_path} has blocks that do not end at the index")
+
+    def read_block(self, block_number):
+        """
+        Return the decoded contents of a single block, using the cache if possible.
+        The block checksum is verified whenever the block is decoded.
+        """
+        if block_number in self.cache:
+            self.cache.move_to_end(block_number)
+            return self.cache[block_number]
+
+        _, compressed_offset, uncompressed_size, compressed_size, method, checksum = self.index[block_number]
+        self.file.seek(compressed_offset)
+        try:
+            block = _decode_block(method, self.file.read(compressed_size))
+        except (ValueError, IndexError, KeyError, TypeError) as e:
+            raise ValueError(f"Block {block_number} could not be decoded") from e
+        if len(block) != uncompressed_size:
+            raise ValueError(f"Block {block_number} decoded to {len(block)} bytes, expected {uncompressed_size}")
+        if zlib.crc32(block) != checksum:
+            raise ValueError(f"Block {block_number} failed its CRC32 check")
+
+        if self.cache_size > 0:
+            self.cache[block_number] = block
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return block
+
+    def iter_blocks(self):
+        """
+        Yield every decoded block in order while checking the whole stream checksum,
+        which is raised as a ValueError once the last block has been decoded.
+        """
+        stream_checksum = 0
+        for block_number in range(len(self.index)):
+            block = self.read_block(block_number)
+            stream_checksum = zlib.crc32(block, stream_checksum)
+            yield block
+        if stream_checksum != self.stream_checksum:
+            raise ValueError("Stream failed its CRC32 check")
+
+    def pread(self, offset, length):
+        """Read up to length bytes starting at offset without moving the current position."""
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if offset < 0 or length < 0:
+            raise ValueError("offset and length must be non-negative")
+        end = min(offset + length, self.size)
+        if offset >= end:
+            return b''
+
+        # Blocks all have block_size uncompressed bytes except possibly the last one
+        output = bytearray()
+        for block_number in range(offset // self.block_size, (end - 1) // self.block_size + 1):
+            block_offset = self.index[block_number][0]
+            block = self.read_block(block_number)
+            output += block[max(offset - block_offset, 0):end - block_offset]
+        return bytes(output)
+
+    def readinto(self, buffer):
+        data = self.pread(self.position, len(buffer))
+        memoryview(buffer).cast('B')[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def readall(self):
+        data = self.pread(self.position, max(self.size - self.position, 0))
+        self.position += len(data)
+        return data
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self.position + offset
+        elif whence == os.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self.position = position
+        return self.position
+
+    def tell(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        return self.position
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+        self.cache.clear()
+        super().close()
+
+
+if __name__ == "__main__":
+    RANGE = range(1, 5)
+    input_files = [f"Samp{i}.bin" for i in RANGE]
+    compressed_files = [f"seekable_Samp{i}.bin" for i in RANGE]
+
+    for i, (input_file, compressed_file) in enumerate(zip(input_files, compressed_files)):
+        print(f"Processing file {i + 1}...")
+
+        start_time = time.time()
+        seekable_compress(input_file, compressed_file, codec='huffman', block_size=16 * 1024)
+        end_time = time.time()
+
+        original_size = os.path.getsize(input_file)
+        compressed_size = os.path.getsize(compressed_file)
+        compression_ratio = compressed_size / original_size if original_size > 0 else float('inf')
+        print(f"Compression ratio: {compression_ratio:.3f}")
+        print(f"Compression time: {end_time - start_time:.2f} seconds")
+
+        # Random access read from the middle of the file
+        offset = original_size // 2
+        with open(input_file, 'rb') as original:
+            original.seek(offset)
+            expected = original.read(100)
+        if seekable_read(compressed_file, offset, 100) == expected:
+            print(f"File {i + 1} random access read verified.")
+        else:
+            print(f"File {i + 1} random access read failed!")
+
+        try:
+            seekable_verify(compressed_file)
+            print(f"File {i + 1} successfully verified! All block and stream checksums match.")
+        except ValueError as e:
+            print(f"File {i + 1} verification failed! {e}")
@@ -0,0 +1,48 @@
+import statistics
+import subprocess
+import sys
+import time
+
+# Cold-start import time of every module of the package, measured in fresh
+# interpreters against the cost of starting an empty interpreter
+BUDGET_MS = 20
+RUNS = 15
+MODULES = [
+    "eit_compression",
+    "eit_compression.huffman",
+    "eit_compression.lz77",
+    "eit_compression.lz77_extended",
+    "eit_compression.lz78",
+    "eit_compression.lz88_adam",
+    "eit_compression.rle",
+    "eit_compression.BTW",
+    "eit_compression.hex_analyze",
+    "eit_compression.seekable",
+]
+
+
+def cold_start_ms(statement):
+    """Median wall time in milliseconds of running statement in a fresh interpreter."""
+    timings = []
+    for _ in range(RUNS):
+        start_time = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append((time.perf_counter() - start_time) * 1000)
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    baseline = cold_start_ms("pass")
+    print(f"Empty interpreter: {baseline:.1f} ms")
+
+    over_budget = []
+    for module in MODULES:
+        import_time = cold_start_ms(f"import {module}") - baseline
+        print(f"{module}: {import_time:.1f} ms")
+        if import_time > BUDGET_MS:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Over the {BUDGET_MS} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+    print(f"All modules import in under {BUDGET_MS} ms.")
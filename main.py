@@ -1,7 +1,6 @@
 import os
 
-from lz88_adam import lz78_compress, lz78_decompress
-from huffman import huffman_compress, huffman_decompress
+from eit_compression.seekable import seekable_compress, seekable_verify
 
 if __name__ == "__main__":
     # TODO make code more readable + typing and docs
@@ -11,15 +10,10 @@ if __name__ == "__main__":
     RANGE = range(1, 5)
     input_files = [f"Samp{i}.bin" for i in RANGE]
     compressed_files = [f"compressed_Samp{i}.bin" for i in RANGE]
-    decompressed_files = [f"decompressed_Samp{i}.bin" for i in RANGE]
 
-    for i, (input_file, compressed_file, decompressed_file) in enumerate(
-            zip(input_files, compressed_files, decompressed_files)):
+    for i, (input_file, compressed_file) in enumerate(zip(input_files, compressed_files)):
         # Compression step
-        huffman_compress(input_file, compressed_file)
-
-        # Decompression step
-        huffman_decompress(compressed_file, decompressed_file)
+        seekable_compress(input_file, compressed_file, codec='huffman')
 
         # print stats
         original_size = os.path.getsize(input_file)
@@ -28,8 +22,10 @@ if __name__ == "__main__":
 
         print(f"\nCompression ratio: {compression_ratio:.3f}")
 
-        with open(input_file, 'rb') as original, open(decompressed_file, 'rb') as decompressed:
-            if original.read() == decompressed.read():
-                print(f"successfully verified! The decompressed file number {i} matches the original.")
-            else:
-                print(f"verification failed! The decompressed file number {i} does not match the original.")
+        # Verification step, decodes every block and checks the embedded checksums
+        # without writing the decompressed file
+        try:
+            seekable_verify(compressed_file)
+            print(f"successfully verified! The compressed file number {i} matches its checksums.")
+        except ValueError as e:
+            print(f"verification failed! The compressed file number {i} is corrupt: {e}")
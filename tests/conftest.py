@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Make the eit_compression package importable when pytest is run directly from the
+# repository root, not only through python -m pytest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
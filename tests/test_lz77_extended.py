@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from eit_compression.lz77_extended import ExtendedLZ77Compressor
+
+
+def roundtrip(compressor, data):
+    return compressor.decompress_bytes(compressor.compress_bytes(data))
+
+
+@pytest.mark.parametrize("data", [b'', b'a', b'ab', b'abc', b'abcd', b'a' * 5, b'a' * 100000, b'ab' * 5000])
+def test_roundtrip_edge_cases(data):
+    assert roundtrip(ExtendedLZ77Compressor(), data) == data
+
+
+@pytest.mark.parametrize("window_size", [1, 16, 300, 1 << 20])
+@pytest.mark.parametrize("max_match", [4, 20, 258, 10000])
+@pytest.mark.parametrize("max_depth", [1, 4, 32])
+def test_roundtrip_random(window_size, max_match, max_depth):
+    rng = random.Random(window_size * 31 + max_match * 7 + max_depth)
+    compressor = ExtendedLZ77Compressor(window_size=window_size, max_match=max_match, max_depth=max_depth)
+    for _ in range(10):
+        alphabet = rng.choice([b'a', b'ab', b'abcd', bytes(range(256))])
+        data = bytes(rng.choice(alphabet) for _ in range(rng.randrange(1500)))
+        data += data[:rng.randrange(len(data) + 1)] + b'x' * rng.randrange(1000)
+        assert roundtrip(compressor, data) == data
+
+
+def test_long_matches_use_length_continuation():
+    data = bytes(range(256)) * 40
+    compressor = ExtendedLZ77Compressor(max_match=5000)
+    compressed = compressor.compress_bytes(data)
+    # 256 literals with their 32 flag bytes, then two matches of up to 5000 bytes
+    assert len(compressed) < 256 + 32 + 2 * (4 + 5000 // 255 + 1)
+    assert compressor.decompress_bytes(compressed) == data
+
+
+def test_distant_repeat_found_in_large_window():
+    rng = random.Random(2)
+    block = bytes(rng.randrange(256) for _ in range(70000))
+    data = block + block
+
+    small_window = ExtendedLZ77Compressor(window_size=1 << 16).compress_bytes(data)
+    large_window = ExtendedLZ77Compressor(window_size=1 << 20).compress_bytes(data)
+    assert len(large_window) < len(small_window) // 1.5
+    assert ExtendedLZ77Compressor().decompress_bytes(large_window) == data
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from eit_compression.rle import (
+    RUNA,
+    RUNB,
+    rle_decode_bytes,
+    rle_encode_bytes,
+    run_length_decoding,
+    run_length_encoding,
+    zero_run_decoding,
+    zero_run_encoding,
+)
+
+
+def reference_zero_run_encoding(values):
+    """Element by element RUNA/RUNB encoding, as written in bzip2."""
+    output = []
+    i = 0
+    while i < len(values):
+        if values[i] == 0:
+            run_end = i
+            while run_end < len(values) and values[run_end] == 0:
+                run_end += 1
+            run_length = run_end - i
+            while run_length > 0:
+                if run_length & 1:
+                    output.append(RUNA)
+                    run_length = (run_length - 1) // 2
+                else:
+                    output.append(RUNB)
+                    run_length = (run_length - 2) // 2
+            i = run_end
+        else:
+            output.append(values[i] + 1)
+            i += 1
+    return output
+
+
+def random_mtf_values(rng, size):
+    # MTF output is dominated by zeros and small values, with the odd large one
+    return [rng.choice([0, 0, 0, 0, 0, 1, 1, 2, 3, rng.randrange(256)]) for _ in range(size)]
+
+
+@pytest.mark.parametrize("values", [[], [0], [5], [0] * 1000, [7] * 1000, [0, 1, 0, 0, 2, 0, 0, 0]])
+def test_zero_run_roundtrip_edge_cases(values):
+    encoded = zero_run_encoding(values)
+    assert encoded.tolist() == reference_zero_run_encoding(values)
+    assert zero_run_decoding(encoded).tolist() == values
+
+
+def test_zero_run_roundtrip_random():
+    rng = random.Random(0)
+    for _ in range(300):
+        values = random_mtf_values(rng, rng.randrange(200))
+        encoded = zero_run_encoding(values)
+        assert encoded.tolist() == reference_zero_run_encoding(values)
+        assert zero_run_decoding(encoded).tolist() == values
+
+
+def test_zero_run_long_run_uses_logarithmic_digits():
+    run_length = (1 << 20) - 1
+    encoded = zero_run_encoding([0] * run_length)
+    assert len(encoded) == 20
+    assert len(zero_run_decoding(encoded)) == run_length
+
+
+def test_run_length_encoding_any_symbols():
+    symbols, lengths = run_length_encoding(['a', 'a', 'b', 'a'])
+    assert symbols.tolist() == ['a', 'b', 'a']
+    assert lengths.tolist() == [2, 1, 1]
+    assert run_length_decoding(symbols, lengths).tolist() == ['a', 'a', 'b', 'a']
+
+
+@pytest.mark.parametrize("data", [b'', b'x', b'ab', b'a' * 255, b'a' * 256, b'b' * 100000 + b'c'])
+def test_rle_bytes_roundtrip(data):
+    assert rle_decode_bytes(rle_encode_bytes(data)) == data
+
+
+def test_rle_bytes_roundtrip_random():
+    rng = random.Random(1)
+    for _ in range(100):
+        data = bytes(rng.choice(b'aab') for _ in range(rng.randrange(500))) + b'z' * rng.randrange(1000)
+        assert rle_decode_bytes(rle_encode_bytes(data)) == data
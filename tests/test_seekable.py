@@ -0,0 +1,214 @@
+import io
+import os
+import random
+
+import pytest
+
+from eit_compression.seekable import (
+    CODECS,
+    INDEX_ENTRY_SIZE,
+    STORED,
+    SeekableReader,
+    seekable_compress,
+    seekable_decompress,
+    seekable_read,
+    seekable_verify,
+)
+
+BLOCK_SIZE = 1000
+OPTIONAL_DEPENDENCIES = {'lz77': 'bitarray', 'rle': 'numpy'}
+
+
+def sample_data(size=4500, seed=0):
+    """Repetitive text followed by random bytes, so some blocks compress and some do not."""
+    rng = random.Random(seed)
+    text = b''.join(rng.choice([b'abc', b'aaaa', b'hello ', b'\x00\x01']) for _ in range(size // 3))
+    return (text[:size // 2] + bytes(rng.randrange(256) for _ in range(size)))[:size]
+
+
+def write_container(tmp_path, data, codec='huffman', block_size=BLOCK_SIZE):
+    input_path = tmp_path / 'input.bin'
+    container_path = tmp_path / 'container.bin'
+    input_path.write_bytes(data)
+    seekable_compress(input_path, container_path, codec=codec, block_size=block_size)
+    return container_path
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_roundtrip_every_codec(tmp_path, codec):
+    if codec in OPTIONAL_DEPENDENCIES:
+        pytest.importorskip(OPTIONAL_DEPENDENCIES[codec])
+    data = sample_data()
+    container_path = write_container(tmp_path, data, codec=codec)
+
+    output_path = tmp_path / 'output.bin'
+    seekable_decompress(container_path, output_path)
+    assert output_path.read_bytes() == data
+
+    # Ranges starting, ending and crossing on block boundaries
+    for offset, length in [(0, 1), (999, 2), (1000, 1000), (500, 3000), (4499, 10), (0, len(data))]:
+        assert seekable_read(container_path, offset, length) == data[offset:offset + length]
+
+
+def test_empty_input(tmp_path):
+    container_path = write_container(tmp_path, b'')
+    seekable_verify(container_path)
+    assert seekable_read(container_path, 0, 10) == b''
+
+    output_path = tmp_path / 'output.bin'
+    seekable_decompress(container_path, output_path)
+    assert output_path.read_bytes() == b''
+
+    with SeekableReader(container_path) as reader:
+        assert reader.index == []
+        assert reader.read() == b''
+
+
+def test_incompressible_blocks_are_stored(tmp_path):
+    data = sample_data()
+    container_path = write_container(tmp_path, data)
+
+    with SeekableReader(container_path) as reader:
+        methods = [entry[4] for entry in reader.index]
+        assert methods[0] == CODECS['huffman']
+        assert methods[-1] == STORED
+        assert reader.read() == data
+
+
+def test_random_seek_and_read(tmp_path):
+    data = sample_data()
+    container_path = write_container(tmp_path, data)
+    rng = random.Random(1)
+
+    with SeekableReader(container_path, cache_size=2) as reader:
+        for _ in range(200):
+            offset = rng.randrange(len(data) + 100)
+            length = rng.randrange(2500)
+            assert reader.seek(offset) == offset
+            assert reader.read(length) == data[offset:offset + length]
+            assert reader.tell() == min(offset + length, max(offset, len(data)))
+
+
+def test_seek_whence(tmp_path):
+    data = sample_data()
+    container_path = write_container(tmp_path, data)
+
+    with SeekableReader(container_path) as reader:
+        reader.seek(100)
+        assert reader.seek(50, os.SEEK_CUR) == 150
+        assert reader.read(10) == data[150:160]
+        assert reader.seek(-20, os.SEEK_END) == len(data) - 20
+        assert reader.read() == data[-20:]
+        with pytest.raises(ValueError):
+            reader.seek(-1)
+        with pytest.raises(ValueError):
+            reader.seek(0, 3)
+
+
+def test_read_past_end(tmp_path):
+    data = sample_data()
+    container_path = write_container(tmp_path, data)
+
+    with SeekableReader(container_path) as reader:
+        reader.seek(len(data) - 5)
+        assert reader.read(100) == data[-5:]
+        assert reader.read(100) == b''
+        reader.seek(len(data) + 1000)
+        assert reader.read() == b''
+        assert reader.pread(len(data) + 1000, 10) == b''
+
+
+def test_cache_stays_within_cache_size(tmp_path):
+    data = sample_data()
+    container_path = write_container(tmp_path, data)
+
+    with SeekableReader(container_path, cache_size=2) as reader:
+        for block_number in [0, 1, 2, 0, 3, 4, 1]:
+            reader.read_block(block_number)
+            assert len(reader.cache) <= 2
+        # The least recently used block is evicted first
+        assert list(reader.cache) == [4, 1]
+
+
+def test_file_like_wrappers(tmp_path):
+    data = sample_data()
+    container_path = write_container(tmp_path, data)
+
+    reader = SeekableReader(container_path)
+    with io.BufferedReader(reader) as buffered:
+        buffered.seek(1500)
+        assert buffered.read(2000) == data[1500:3500]
+    assert reader.closed
+
+    with pytest.raises(ValueError):
+        reader.read(1)
+
+
+def test_invalid_block_size(tmp_path):
+    with pytest.raises(ValueError):
+        write_container(tmp_path, b'abc', block_size=0)
+    with pytest.raises(ValueError):
+        write_container(tmp_path, b'abc', codec='lz78', block_size=(1 << 16) + 1)
+
+
+def corrupt(path, position, mask=0x01):
+    data = bytearray(path.read_bytes())
+    data[position] ^= mask
+    path.write_bytes(bytes(data))
+
+
+def assert_rejected(tmp_path, container_path):
+    with pytest.raises(ValueError):
+        seekable_verify(container_path)
+    with pytest.raises(ValueError):
+        seekable_decompress(container_path, tmp_path / 'output.bin')
+
+
+@pytest.mark.parametrize("block_number", [0, 4])
+def test_corrupt_payload_byte_is_detected(tmp_path, block_number):
+    container_path = write_container(tmp_path, sample_data())
+    with SeekableReader(container_path) as reader:
+        _, compressed_offset, _, compressed_size, _, _ = reader.index[block_number]
+
+    corrupt(container_path, compressed_offset + compressed_size // 2)
+    assert_rejected(tmp_path, container_path)
+
+
+@pytest.mark.parametrize("cut", [1, 20, 200])
+def test_truncated_container_is_detected(tmp_path, cut):
+    container_path = write_container(tmp_path, sample_data())
+    container_path.write_bytes(container_path.read_bytes()[:-cut])
+    assert_rejected(tmp_path, container_path)
+
+
+def test_corrupt_stream_checksum_is_detected(tmp_path):
+    container_path = write_container(tmp_path, sample_data())
+    # The stream CRC32 sits just before the 4 byte footer magic
+    corrupt(container_path, os.path.getsize(container_path) - 5)
+    assert_rejected(tmp_path, container_path)
+
+
+def test_corrupt_index_offset_is_detected(tmp_path):
+    container_path = write_container(tmp_path, sample_data())
+    with SeekableReader(container_path) as reader:
+        index_offset = reader.index[-1][1] + reader.index[-1][3]
+
+    # Flip a bit in the uncompressed offset of the 4th index entry
+    corrupt(container_path, index_offset + 3 * INDEX_ENTRY_SIZE + 6)
+    assert_rejected(tmp_path, container_path)
+
+
+def test_verify_passes_on_intact_container(tmp_path):
+    container_path = write_container(tmp_path, sample_data())
+    seekable_verify(container_path)
+
+
+def test_cache_size_zero_never_caches(tmp_path):
+    data = sample_data()
+    container_path = write_container(tmp_path, data)
+
+    with SeekableReader(container_path, cache_size=0) as reader:
+        assert b''.join(reader.iter_blocks()) == data
+        assert reader.read() == data
+        reader.read_block(0)
+        assert len(reader.cache) == 0